@@ -15,6 +15,8 @@
         devShells.default = pkgs.mkShell {
           buildInputs = with pkgs; [
             (python312.withPackages (ps: with ps; [
+              numba
+              numpy
               pillow
             ]))
           ];
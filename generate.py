@@ -1,8 +1,86 @@
 import sys
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from numba import njit
+
 from crossword import *
 
 
+def _letter_table(words, min_width):
+    """
+    Return a (len(words), width) uint8 matrix whose row k holds the
+    letters of words[k], zero-padded on the right. The width is at least
+    `min_width`, so column slices as wide as any variable stay in bounds
+    even when every word is shorter than the variable.
+
+    After Crossword's .upper(), every data byte falls in 39-90
+    (apostrophe through 'Z'); the bitmask kernels and the minlength=91
+    bincounts in order_domain_values rely on that range.
+    """
+    width = max(max(map(len, words), default=1), min_width)
+    table = np.zeros((len(words), width), dtype=np.uint8)
+    for k, word in enumerate(words):
+        table[k, :len(word)] = np.frombuffer(word.encode(), dtype=np.uint8)
+    return table
+
+
+@njit(cache=True, nogil=True)
+def _column_mask(column):
+    """
+    Fold a uint8 letter column into a uint64 bitmask with bit
+    (c - 'A') mod 64 set iff byte c appears in the column. The mod keeps
+    the shift defined for bytes below 'A' (hyphens and apostrophes
+    survive .upper()), and every byte in 39-90 still maps to a distinct
+    bit.
+    """
+    mask = np.uint64(0)
+    for letter in column:
+        shift = (np.uint64(letter) - np.uint64(65)) & np.uint64(63)
+        mask |= np.uint64(1) << shift
+    return mask
+
+
+@njit(cache=True, nogil=True)
+def _mask_keep(column, mask):
+    """
+    Return a boolean array marking which bytes of a uint8 column have
+    their (c - 'A') mod 64 bit set in `mask`.
+    """
+    keep = np.empty(column.shape[0], dtype=np.bool_)
+    for k in range(column.shape[0]):
+        shift = (np.uint64(column[k]) - np.uint64(65)) & np.uint64(63)
+        keep[k] = (mask >> shift) & np.uint64(1)
+    return keep
+
+
+# Body of the per-arc revise functions compiled in CrosswordCreator.__init__,
+# with the overlap indices {i} and {j} substituted as integer literals
+_REVISE_TEMPLATE = """
+def f(self, x, y):
+    dom_y = self.dom_np[y]
+    entry = self.letter_mask.get((y, {j}))
+    if entry is None or entry[0] is not dom_y:
+        mask = _column_mask(dom_y[:, {j}])
+        self.letter_mask[y, {j}] = (dom_y, mask)
+    else:
+        mask = entry[1]
+
+    keep = _mask_keep(self.dom_np[x][:, {i}], mask)
+    if keep.all():
+        return False
+
+    self.dom_np[x] = self.dom_np[x][keep]
+    self.dom_ids[x] = [
+        wid for wid, kept in zip(self.dom_ids[x], keep) if kept
+    ]
+    self.domains[x] = set(self.dom_ids[x])
+    return True
+"""
+
+
 class CrosswordCreator():
 
     def __init__(self, crossword):
@@ -10,25 +88,86 @@ class CrosswordCreator():
         Create new CSP crossword generate.
         """
         self.crossword = crossword
+        # Materialize the neighbor sets (and their sizes, for the degree
+        # heuristic) once; Crossword.neighbors rebuilds its set on each call
+        self.neighbors = {
+            var: frozenset(self.crossword.neighbors(var))
+            for var in self.crossword.variables
+        }
+        self.degree = {var: len(self.neighbors[var]) for var in self.crossword.variables}
+        # Every real arc of the problem, and its overlap indices, computed
+        # once: ac3 re-enqueues arcs constantly and revise needs the indices
+        # on every call
+        self.arcs = [
+            (x, y)
+            for x in self.crossword.variables
+            for y in self.neighbors[x]
+        ]
+        self.overlap_ij = {
+            (x, y): self.crossword.overlaps[x, y] for x, y in self.arcs
+        }
+        # Per-arc revise functions with the overlap indices baked in as
+        # literals, so the hot path skips the index lookup and unpack
+        self._revise_fn = dict()
+        for (x, y), (i, j) in self.overlap_ij.items():
+            namespace = {"_column_mask": _column_mask, "_mask_keep": _mask_keep}
+            exec(_REVISE_TEMPLATE.format(i=i, j=j), namespace)
+            self._revise_fn[x, y] = namespace["f"]
+        # Intern the vocabulary: every word gets a dense integer ID, and
+        # letter_at[id, p] holds the word's letter at position p (padded
+        # with zeros). Domains hold IDs, so set operations hash and compare
+        # small ints instead of strings
+        self.word_list = list(self.crossword.words)
+        self.word_id = {word: wid for wid, word in enumerate(self.word_list)}
+        self.letter_at = _letter_table(
+            self.word_list,
+            max((var.length for var in self.crossword.variables), default=1)
+        )
         self.domains = {
-            var: self.crossword.words.copy()
+            var: set(range(len(self.word_list)))
             for var in self.crossword.variables
         }
+        # Structure-of-arrays view of the domains, built by
+        # enforce_node_consistency once each domain is rectangular:
+        # dom_ids[v] lists the word IDs and dom_np[v] holds their letters
+        # as a (|domain|, v.length) uint8 matrix, rows in the same order
+        self.dom_ids = dict()
+        self.dom_np = dict()
+        # Lazy letter-count cache for order_domain_values, same staleness
+        # scheme as letter_mask below: (var, position) -> (letter matrix,
+        # per-letter occurrence counts for that column)
+        self.letter_count = dict()
+        # Lazy bitmask cache: (var, position) -> (letter matrix, uint64 mask
+        # with bit (c-'A') mod 64 set iff some domain word has byte c there).
+        # The
+        # matrix reference is the staleness token: domain views are replaced,
+        # never mutated, so an entry is valid iff its matrix is still the
+        # variable's current one -- even across backtrack restores
+        self.letter_mask = dict()
+        # For each variable, the set of assigned variables whose propagation
+        # pruned its domain; used to build conflict sets for backjumping
+        self.prune_causes = {var: set() for var in self.crossword.variables}
+        # Variable whose domain was emptied by the last failed ac3 call
+        self._wipeout = None
+        # Letter tiles rendered by save(), kept across calls so repeated
+        # saves never re-measure or re-rasterize a glyph
+        self._glyph_cache = dict()
 
     def letter_grid(self, assignment):
         """
-        Return 2D array representing a given assignment.
+        Return a flat height*width bytearray representing a given
+        assignment: cell (i, j) lives at index i * width + j and holds the
+        letter's byte value, or 0 if the cell is empty.
         """
-        letters = [
-            [None for _ in range(self.crossword.width)]
-            for _ in range(self.crossword.height)
-        ]
+        width = self.crossword.width
+        letters = bytearray(self.crossword.height * width)
         for variable, word in assignment.items():
-            direction = variable.direction
-            for k in range(len(word)):
-                i = variable.i + (k if direction == Variable.DOWN else 0)
-                j = variable.j + (k if direction == Variable.ACROSS else 0)
-                letters[i][j] = word[k]
+            # One index stride per word instead of per-cell arithmetic
+            di = 1 if variable.direction == Variable.DOWN else 0
+            stride = di * width + (1 - di)
+            base = variable.i * width + variable.j
+            for k, letter in enumerate(word.encode()):
+                letters[base + k * stride] = letter
         return letters
 
     def print(self, assignment):
@@ -39,7 +178,8 @@ class CrosswordCreator():
         for i in range(self.crossword.height):
             for j in range(self.crossword.width):
                 if self.crossword.structure[i][j]:
-                    print(letters[i][j] or " ", end="")
+                    letter = letters[i * self.crossword.width + j]
+                    print(chr(letter) if letter else " ", end="")
                 else:
                     print("█", end="")
             print()
@@ -62,26 +202,38 @@ class CrosswordCreator():
             "black"
         )
         font = ImageFont.truetype("assets/fonts/OpenSans-Regular.ttf", 80)
-        draw = ImageDraw.Draw(img)
+
+        # Render one white interior tile and, lazily, one tile per distinct
+        # letter; each cell is then a paste instead of a rectangle fill and
+        # a full text layout. The glyph tiles (and with them the font
+        # metrics) live on the instance, shared by every save() call
+        white_cell = Image.new("RGBA", (interior_size, interior_size), "white")
+        glyphs = self._glyph_cache
 
         for i in range(self.crossword.height):
             for j in range(self.crossword.width):
 
-                rect = [
-                    (j * cell_size + cell_border,
-                     i * cell_size + cell_border),
-                    ((j + 1) * cell_size - cell_border,
-                     (i + 1) * cell_size - cell_border)
-                ]
                 if self.crossword.structure[i][j]:
-                    draw.rectangle(rect, fill="white")
-                    if letters[i][j]:
-                        _, _, w, h = draw.textbbox((0, 0), letters[i][j], font=font)
-                        draw.text(
-                            (rect[0][0] + ((interior_size - w) / 2),
-                             rect[0][1] + ((interior_size - h) / 2) - 10),
-                            letters[i][j], fill="black", font=font
-                        )
+                    left = j * cell_size + cell_border
+                    top = i * cell_size + cell_border
+                    img.paste(white_cell, (left, top))
+                    letter = letters[i * self.crossword.width + j]
+                    if letter:
+                        letter = chr(letter)
+                        glyph = glyphs.get(letter)
+                        if glyph is None:
+                            glyph = Image.new(
+                                "RGBA", (interior_size, interior_size), (0, 0, 0, 0)
+                            )
+                            glyph_draw = ImageDraw.Draw(glyph)
+                            _, _, w, h = glyph_draw.textbbox((0, 0), letter, font=font)
+                            glyph_draw.text(
+                                (((interior_size - w) / 2),
+                                 ((interior_size - h) / 2) - 10),
+                                letter, fill="black", font=font
+                            )
+                            glyphs[letter] = glyph
+                        img.paste(glyph, (left, top), glyph)
 
         img.save(filename)
 
@@ -100,14 +252,20 @@ class CrosswordCreator():
          constraints; in this case, the length of the word.)
         """
         for var in self.domains:
-            # Create a new set to store valid words
-            valid_words = set()
-            for word in self.domains[var]:
-                # Check if word length matches variable length
-                if len(word) == var.length:
-                    valid_words.add(word)
-            # Update domain with only valid words
-            self.domains[var] = valid_words
+            # Rebuild the domain in a single pass, keeping only the words
+            # whose length matches the variable's
+            valid_ids = {
+                wid for wid in self.domains[var]
+                if len(self.word_list[wid]) == var.length
+            }
+            self.domains[var] = valid_ids
+            # All remaining words share var.length, so the domain can now
+            # be mirrored as a letter matrix for vectorized revision
+            self.dom_ids[var] = list(valid_ids)
+            self.dom_np[var] = self.letter_at[
+                np.fromiter(self.dom_ids[var], dtype=np.intp, count=len(valid_ids)),
+                :var.length
+            ]
 
     def revise(self, x, y):
         """
@@ -118,32 +276,34 @@ class CrosswordCreator():
         Return True if a revision was made to the domain of `x`; return
         False if no revision was made.
         """
-        revised = False
-        
-        # Get the overlap between variables x and y
-        overlap = self.crossword.overlaps[x, y]
-        
-        # If there's no overlap, no revision needed
-        if overlap is None:
+        # Dispatch to the arc's compiled function; if there's no overlap,
+        # no revision needed. A word of x is supported iff the bit for its
+        # overlap letter is set in y's mask, maintained inside the function
+        fn = self._revise_fn.get((x, y))
+        if fn is None:
             return False
-        
-        # Get the indices where the variables overlap
-        i, j = overlap
-        
-        # Create a copy of the domain to avoid modifying during iteration
-        words_to_remove = set()
-        
-        # Check each word in the domain of x
-        for word_x in self.domains[x]:
-            # Check if there's any word in y's domain that satisfies the constraint
-            if not any(word_x[i] == word_y[j] for word_y in self.domains[y]):
-                words_to_remove.add(word_x)
-                revised = True
-        
-        # Remove words that don't satisfy the constraint
-        self.domains[x] -= words_to_remove
-        
-        return revised
+        return fn(self, x, y)
+
+    def _components(self):
+        """
+        Return the connected components of the constraint graph as a list
+        of variable sets.
+        """
+        components = []
+        unseen = set(self.crossword.variables)
+        while unseen:
+            start = unseen.pop()
+            component = {start}
+            frontier = deque([start])
+            while frontier:
+                var = frontier.popleft()
+                for neighbor in self.neighbors[var]:
+                    if neighbor in unseen:
+                        unseen.discard(neighbor)
+                        component.add(neighbor)
+                        frontier.append(neighbor)
+            components.append(component)
+        return components
 
     def ac3(self, arcs=None):
         """
@@ -154,26 +314,48 @@ class CrosswordCreator():
         Return True if arc consistency is enforced and no domains are empty;
         return False if one or more domains end up empty.
         """
-        # Initialize queue of arcs to process
+        # When starting from scratch, disjoint components of the constraint
+        # graph cannot influence each other, so propagate each in its own
+        # thread; the compiled kernels release the GIL for the heavy work.
+        # Arc-seeded calls (MAC inside backtrack) stay single-threaded since
+        # each depends on the state left by the previous one
         if arcs is None:
-            queue = [(x, y) for x in self.crossword.variables for y in self.crossword.neighbors(x)]
+            components = self._components()
+            if len(components) > 1:
+                batches = [
+                    [(x, y) for x, y in self.arcs if x in component]
+                    for component in components
+                ]
+                with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+                    results = executor.map(lambda batch: self.ac3(arcs=batch), batches)
+                return all(results)
+            queue = deque(self.arcs)
         else:
-            queue = list(arcs)
-        
+            queue = deque(arcs)
+
+        # Track queue membership in a set so the same arc is never queued
+        # twice
+        in_queue = set(queue)
+
         # Process each arc in the queue
         while queue:
-            x, y = queue.pop(0)
-            
+            x, y = queue.popleft()
+            in_queue.discard((x, y))
+
             # Try to revise the domain of x with respect to y
             if self.revise(x, y):
                 # If domain of x is empty, problem is unsolvable
                 if len(self.domains[x]) == 0:
+                    self._wipeout = x
                     return False
-                
-                # Add new arcs for all neighbors of x (except y)
-                for z in self.crossword.neighbors(x) - {y}:
-                    queue.append((z, x))
-        
+
+                # Add new arcs for all neighbors of x (except y),
+                # skipping arcs already waiting in the queue
+                for z in self.neighbors[x] - {y}:
+                    if (z, x) not in in_queue:
+                        queue.append((z, x))
+                        in_queue.add((z, x))
+
         return True
 
     def assignment_complete(self, assignment):
@@ -198,21 +380,42 @@ class CrosswordCreator():
             if len(word) != var.length:
                 return False
         
-        # Check if there are no conflicts between neighboring variables
+        # Check if there are no conflicts between neighboring variables;
+        # only assigned neighbors can conflict, so intersect the neighbor
+        # sets with the assignment instead of enumerating all pairs
         for var1 in assignment:
-            for var2 in assignment:
-                if var1 != var2:
-                    # Get the overlap between the variables
-                    overlap = self.crossword.overlaps[var1, var2]
-                    
-                    # If there is an overlap, check for conflict
-                    if overlap:
-                        i, j = overlap
-                        if assignment[var1][i] != assignment[var2][j]:
-                            return False
-        
+            for var2 in self.neighbors[var1] & assignment.keys():
+                i, j = self.overlap_ij[var1, var2]
+                if assignment[var1][i] != assignment[var2][j]:
+                    return False
+
         return True
 
+    def _conflicts(self, var, value, assignment, used):
+        """
+        Return the set of assigned variables that conflict with assigning
+        `value` to `var`; an empty set means the assignment stays
+        consistent.
+
+        `used` maps each assigned word ID to its variable, maintained by
+        the search so the uniqueness check is O(1) instead of a scan
+        over `assignment.values()`.
+        """
+        conflicts = set()
+
+        # Words must be unique across the puzzle
+        owner = used.get(value)
+        if owner is not None:
+            conflicts.add(owner)
+
+        # Check overlap conflicts against assigned neighbors only
+        for neighbor in self.neighbors[var] & assignment.keys():
+            i, j = self.overlap_ij[var, neighbor]
+            if self.letter_at[value, i] != self.letter_at[assignment[neighbor], j]:
+                conflicts.add(neighbor)
+
+        return conflicts
+
     def order_domain_values(self, var, assignment):
         """
         Return a list of values in the domain of `var`, in order by
@@ -220,32 +423,31 @@ class CrosswordCreator():
         The first value in the list, for example, should be the one
         that rules out the fewest values among the neighbors of `var`.
         """
-        # Dictionary to count how many values each domain value rules out
+        # For each unassigned neighbor, fetch per-letter occurrence counts
+        # for its overlap column; a word placing letter c in the overlap
+        # rules out |D_n| - count[c] of the neighbor's words
+        tallies = []
+        for neighbor in self.neighbors[var] - assignment.keys():
+            i, j = self.overlap_ij[var, neighbor]
+            entry = self.letter_count.get((neighbor, j))
+            if entry is None or entry[0] is not self.dom_np[neighbor]:
+                count = np.bincount(self.dom_np[neighbor][:, j], minlength=91)
+                self.letter_count[neighbor, j] = (self.dom_np[neighbor], count)
+            else:
+                count = entry[1]
+            tallies.append((i, len(self.domains[neighbor]), count))
+
+        # Dictionary to count how many values each domain value rules out,
+        # now O(1) per (word, neighbor) instead of a scan of the neighbor
         constraints = {}
-        
-        # Get unassigned neighbors
-        unassigned_neighbors = [n for n in self.crossword.neighbors(var) if n not in assignment]
-        
-        # For each word in the domain of var
-        for word in self.domains[var]:
-            count = 0
-            
-            # Check against each unassigned neighbor
-            for neighbor in unassigned_neighbors:
-                # Get the overlap
-                overlap = self.crossword.overlaps[var, neighbor]
-                if overlap:
-                    i, j = overlap
-                    
-                    # Count how many values in the neighbor's domain would be ruled out
-                    for neighbor_word in self.domains[neighbor]:
-                        if word[i] != neighbor_word[j]:
-                            count += 1
-                            
-            constraints[word] = count
-        
+        for wid in self.domains[var]:
+            constraints[wid] = sum(
+                size - count[self.letter_at[wid, i]]
+                for i, size, count in tallies
+            )
+
         # Sort domain values by the number of constraints they impose
-        return sorted(self.domains[var], key=lambda word: constraints[word])
+        return sorted(self.domains[var], key=lambda wid: constraints[wid])
 
     def select_unassigned_variable(self, assignment):
         """
@@ -255,22 +457,21 @@ class CrosswordCreator():
         degree. If there is a tie, any of the tied variables are acceptable
         return values.
         """
-        # Find unassigned variables
-        unassigned = [var for var in self.crossword.variables if var not in assignment]
-        
-        # If no unassigned variables, return None
-        if not unassigned:
-            return None
-        
-        # Sort by the minimum remaining value (MRV) heuristic
-        # If tied, sort by degree heuristic (number of neighbors)
-        return min(
-            unassigned,
-            key=lambda var: (
-                len(self.domains[var]),             # MRV - prefer fewer remaining values
-                -len(self.crossword.neighbors(var)) # Degree - prefer more neighbors (negative to sort in descending order)
-            )
-        )
+        # Single pass over the variables, tracking the best candidate by
+        # the minimum remaining value (MRV) heuristic, ties broken by the
+        # degree heuristic (more neighbors first)
+        best = None
+        best_key = None
+        for var in self.crossword.variables:
+            if var in assignment:
+                continue
+            key = (len(self.domains[var]), -self.degree[var])
+            if best_key is None or key < best_key:
+                best = var
+                best_key = key
+
+        # If no unassigned variables, this returns None
+        return best
 
     def backtrack(self, assignment):
         """
@@ -281,30 +482,143 @@ class CrosswordCreator():
 
         If no assignment is possible, return None.
         """
-        # Check if the assignment is complete
-        if self.assignment_complete(assignment):
-            return assignment
-        
-        # Select an unassigned variable
-        var = self.select_unassigned_variable(assignment)
-        
-        # Try each value in the domain of the variable
-        for value in self.order_domain_values(var, assignment):
-            # Create a new assignment with the new value
-            assignment[var] = value
-            
-            # Check if the assignment is consistent
-            if self.consistent(assignment):
-                # Recursively try to complete the assignment
-                result = self.backtrack(assignment)
-                if result is not None:
-                    return result
-            
-            # If we reach here, the assignment didn't work, remove the value
-            del assignment[var]
-        
-        # If no value works, return None (backtrack)
-        return None
+        # The search runs on word IDs internally; translate words at the
+        # public boundary. `used` maps each assigned ID to its variable,
+        # maintained across recursive calls so each step checks uniqueness
+        # in O(1)
+        ids = {var: self.word_id[word] for var, word in assignment.items()}
+        used = {wid: var for var, wid in ids.items()}
+
+        result, _ = self._backtrack_cbj(ids, used)
+        if result is None:
+            return None
+        return {var: self.word_list[wid] for var, wid in result.items()}
+
+    def _backtrack_cbj(self, assignment, used):
+        """
+        Backtracking search with conflict-directed backjumping, operating
+        on word IDs throughout.
+
+        Return `(assignment, None)` on success. On failure, return
+        `(None, conflict_set)` where `conflict_set` contains the assigned
+        variables responsible for the dead end; frames whose variable is
+        not in that set jump straight past their remaining values.
+
+        The search runs as an explicit stack of frames instead of Python
+        recursion: descending pushes a frame, failing pops one, and each
+        frame carries the saved domain views needed to undo its decision.
+        """
+        # Stack of open decisions; each frame tracks the chosen variable,
+        # its remaining-values iterator, its conflict set, and the undo
+        # state (value, saved domain views, pruned variables) for the value
+        # currently being tried
+        frames = []
+        # Conflict set handed up by a failed deeper frame, or None when the
+        # next step is to descend into a fresh frame
+        child_conflict = None
+
+        while True:
+            if child_conflict is None:
+                # Descend: open a frame for the next unassigned variable
+                if self.assignment_complete(assignment):
+                    return assignment, None
+                var = self.select_unassigned_variable(assignment)
+                frames.append({
+                    "var": var,
+                    "values": iter(self.order_domain_values(var, assignment)),
+                    # The variable's current domain already reflects pruning
+                    # by earlier decisions, so they start off in conflict
+                    "conflict": set(self.prune_causes[var]),
+                    "value": None,
+                    "saved": None,
+                    "changed": None,
+                })
+            else:
+                # Resume: a deeper frame failed, so undo this frame's
+                # current value before deciding what to do with it
+                frame = frames[-1]
+                var = frame["var"]
+                self.domains, self.dom_ids, self.dom_np = frame["saved"]
+                for v in frame["changed"]:
+                    self.prune_causes[v].discard(var)
+                del assignment[var]
+                del used[frame["value"]]
+
+                if var not in child_conflict:
+                    # This decision played no part in the failure below:
+                    # jump past its remaining values and keep unwinding
+                    frames.pop()
+                    if not frames:
+                        return None, child_conflict
+                    continue
+
+                # Absorb the deeper conflict, minus var itself
+                frame["conflict"] |= child_conflict - {var}
+                child_conflict = None
+
+            # Advance the top frame to its next workable value
+            frame = frames[-1]
+            var = frame["var"]
+            descended = False
+            for value in frame["values"]:
+                # Only the new variable needs validation: the rest of the
+                # assignment was consistent before this step
+                culprits = self._conflicts(var, value, assignment, used)
+                if culprits:
+                    frame["conflict"] |= culprits
+                    continue
+
+                assignment[var] = value
+                used[value] = var
+
+                # Maintain arc consistency: snapshot domains, commit to
+                # this value, and propagate it to the unassigned neighbors;
+                # revise replaces domain views rather than mutating them,
+                # so shallow dict copies are enough to snapshot
+                saved = (dict(self.domains), dict(self.dom_ids), dict(self.dom_np))
+                self.domains[var] = {value}
+                self.dom_ids[var] = [value]
+                self.dom_np[var] = self.letter_at[np.array([value], dtype=np.intp), :var.length]
+                inferences_ok = self.ac3(arcs=[
+                    (y, var) for y in self.neighbors[var]
+                    if y not in assignment
+                ])
+
+                # Attribute every domain pruned by this propagation to var
+                changed = [
+                    v for v in saved[0]
+                    if len(self.domains[v]) != len(saved[0][v])
+                ]
+                for v in changed:
+                    self.prune_causes[v].add(var)
+
+                if inferences_ok:
+                    frame["value"] = value
+                    frame["saved"] = saved
+                    frame["changed"] = changed
+                    descended = True
+                    break
+
+                # Propagation emptied a domain; blame the decisions that
+                # pruned it (var among them) and undo immediately
+                frame["conflict"] |= self.prune_causes[self._wipeout] - {var}
+                self.domains, self.dom_ids, self.dom_np = saved
+                for v in changed:
+                    self.prune_causes[v].discard(var)
+                del assignment[var]
+                del used[value]
+
+            if descended:
+                child_conflict = None
+                continue
+
+            # No value works: pop the frame and report which decisions
+            # caused the dead end
+            conflict = frame["conflict"]
+            frames.pop()
+            if not frames:
+                return None, conflict
+            child_conflict = conflict
 
 
 def main():